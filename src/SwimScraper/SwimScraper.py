@@ -1,25 +1,186 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
-from bs4 import BeautifulSoup as bs
+from bs4 import BeautifulSoup as bs, SoupStrainer
+import soupsieve as sv
+import numpy as np
 import pandas as pd
 import time as _time
-
-# Selenium is only used by a few legacy functions.
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import (
-    TimeoutException,
-    NoSuchElementException,
-    StaleElementReferenceException,
-)
+import copy
+import functools
+import shelve
+import threading
+from collections import OrderedDict
+from itertools import groupby
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# orjson is an optional, faster drop-in for decoding the JSON endpoints.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from pathlib import Path
 from datetime import datetime
 SWIMCLOUD_SWIMMER_API = "https://www.swimcloud.com/api/swimmers"
 
+# Number of concurrent requests for per-event fan-outs (kept <= pool_maxsize)
+MAX_WORKERS = 8
+
+# ---------------------------------------------------------------------------
+# HTTP SESSION
+# ---------------------------------------------------------------------------
+# One shared session so every SwimCloud call reuses pooled keep-alive
+# connections instead of paying a new TCP+TLS handshake per request.
+
+def _build_session():
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0",
+        "Accept": "application/json",
+    })
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # hand back the last response once retries run out, so callers'
+        # status_code / raise_for_status() checks still apply
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries),
+    )
+    return session
+
+
+_SESSION = _build_session()
+
+
+def set_session(session):
+    """Replace the shared requests.Session (e.g. a cached or mocked one)."""
+    global _SESSION
+    _SESSION = session
+
+
+# ---------------------------------------------------------------------------
+# JSON RESPONSE CACHE
+# ---------------------------------------------------------------------------
+# Swimmer JSON endpoints are stable within a day, so responses are memoized
+# in an in-memory LRU and, optionally, persisted to a shelve file on disk.
+# Expired entries keep their ETag/Last-Modified so the refetch can be a
+# conditional GET; a 304 reuses the cached body.
+
+CACHE_TTL = 24 * 60 * 60  # seconds before a cached response is revalidated
+CACHE_MAXSIZE = 4096      # max entries kept in memory
+
+_cache = OrderedDict()    # key -> (fetched_at, data, etag, last_modified)
+_cache_lock = threading.Lock()
+_cache_path = None        # shelve path when the disk layer is enabled
+
+
+def _default_cache_path():
+    """Return default location of the on-disk JSON cache (next to this file)."""
+    return Path(__file__).with_name(".swimcache")
+
+
+def set_cache_path(path=None):
+    """Enable the on-disk JSON cache at `path` (default: next to this file)."""
+    global _cache_path
+    if path is None:
+        path = _default_cache_path()
+    _cache_path = str(path)
+
+
+def clear_cache():
+    """Drop every cached JSON response, in memory and on disk."""
+    with _cache_lock:
+        _cache.clear()
+        if _cache_path is not None:
+            with shelve.open(_cache_path) as db:
+                db.clear()
+
+
+def _cache_get(key):
+    """Return the cache entry for key (possibly expired), or None."""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None and _cache_path is not None:
+            with shelve.open(_cache_path) as db:
+                entry = db.get(key)
+        if entry is None:
+            return None
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+        return entry
+
+
+def _cache_set(key, data, etag=None, last_modified=None):
+    entry = (_time.time(), data, etag, last_modified)
+    with _cache_lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+        if _cache_path is not None:
+            with shelve.open(_cache_path) as db:
+                db[key] = entry
+
+
+def _cache_clear_prefix(prefix):
+    with _cache_lock:
+        for key in [k for k in _cache if k.startswith(prefix)]:
+            del _cache[key]
+        if _cache_path is not None:
+            with shelve.open(_cache_path) as db:
+                for key in [k for k in db.keys() if k.startswith(prefix)]:
+                    del db[key]
+
+
+def _get_json(endpoint, url, params=None):
+    """
+    GET a SwimCloud JSON endpoint through the cache.
+
+    Keyed on the endpoint name plus the full URL, so 433591 and '433591'
+    share one entry. Fresh hits skip the network; expired entries are
+    revalidated with If-None-Match / If-Modified-Since.
+
+    Callers get a deep copy, so mutating the result never alters the cache.
+    """
+    key = f"{endpoint}:{url}"
+    if params:
+        key += "?" + urlencode(params)
+
+    entry = _cache_get(key)
+    if entry is not None and _time.time() - entry[0] <= CACHE_TTL:
+        return copy.deepcopy(entry[1])
+
+    headers = {}
+    if entry is not None:
+        if entry[2]:
+            headers["If-None-Match"] = entry[2]
+        if entry[3]:
+            headers["If-Modified-Since"] = entry[3]
+
+    r = _SESSION.get(url, params=params, headers=headers)
+    if r.status_code == 304 and entry is not None:
+        data = entry[1]
+        etag = r.headers.get("ETag", entry[2])
+        last_modified = r.headers.get("Last-Modified", entry[3])
+    else:
+        r.raise_for_status()
+        data = _json_loads(r.content)
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+
+    _cache_set(key, data, etag, last_modified)
+    return copy.deepcopy(data)
+
+
 # ---------------------------------------------------------------------------
 # JSON-BASED HELPERS (NEW STYLE)
 # ---------------------------------------------------------------------------
@@ -31,14 +192,13 @@ STROKE_CODES = {
     "5": "IM",
 }
 
+# SwimCloud eventgender -> numeric code used in event tokens (0 = unknown)
+_GENDER_CODE = {"M": 1, "F": 2}
+
+
 def _gender_code(eventgender: str) -> int:
     """Map SwimCloud eventgender ('M'/'F') to numeric code used in event token."""
-    if eventgender == "M":
-        return 1
-    if eventgender == "F":
-        return 2
-    # fallback, just in case
-    return 0
+    return _GENDER_CODE.get(eventgender, 0)
 
 def _stroke_name(code) -> str:
     return STROKE_CODES.get(str(code), str(code))
@@ -57,11 +217,13 @@ def _event_token_from_record(rec: dict) -> str:
         gender_code|distance|course|stroke_code
     Example: '1|50|Y|1' == M 50y Free
     """
-    gender_code = _gender_code(rec.get("eventgender"))
-    distance = rec.get("eventdistance")
-    course = rec.get("eventcourse")
-    stroke_code = rec.get("eventstroke")
-    return f"{gender_code}|{distance}|{course}|{stroke_code}"
+    get = rec.get
+    return "%d|%s|%s|%s" % (
+        _GENDER_CODE.get(get("eventgender"), 0),
+        get("eventdistance"),
+        get("eventcourse"),
+        get("eventstroke"),
+    )
 
 def getTeamPerformance(team_id, gender="M", event_course="Y", rank_type="D", limit=200):
     """
@@ -83,14 +245,9 @@ def getTeamPerformance(team_id, gender="M", event_course="Y", rank_type="D", lim
         "team_id": team_id,
     }
 
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json",
-    }
-
-    r = requests.get(url, params=params, headers=headers)
+    r = _SESSION.get(url, params=params)
     r.raise_for_status()
-    data = r.json()
+    data = _json_loads(r.content)
     return data.get("results", [])
 
 
@@ -105,13 +262,12 @@ def getSwimmerProfileFastestTimes(swimmer_ID):
     'one row per event' best time (good for a quick performance snapshot).
     """
     url = f"{SWIMCLOUD_SWIMMER_API}/{swimmer_ID}/profile_fastest_times/"
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json",
-    }
-    r = requests.get(url, headers=headers)
-    r.raise_for_status()
-    return r.json()
+    return _get_json("profile_fastest_times", url)
+
+
+getSwimmerProfileFastestTimes.cache_clear = functools.partial(
+    _cache_clear_prefix, "profile_fastest_times:"
+)
 
 
 def getSwimmerTimesByEventJSON(swimmer_ID, event_token):
@@ -128,13 +284,12 @@ def getSwimmerTimesByEventJSON(swimmer_ID, event_token):
     """
     url = f"{SWIMCLOUD_SWIMMER_API}/{swimmer_ID}/times_by_event/"
     params = {"event": event_token}  # requests will URL-encode the '|'
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json",
-    }
-    r = requests.get(url, params=params, headers=headers)
-    r.raise_for_status()
-    return r.json()
+    return _get_json("times_by_event", url, params)
+
+
+getSwimmerTimesByEventJSON.cache_clear = functools.partial(
+    _cache_clear_prefix, "times_by_event:"
+)
 
 
 def swimmer_times_to_dataframe(times_json):
@@ -203,6 +358,21 @@ def getSwimmerEventTokens(swimmer_ID):
 
     return tokens
 
+def _swim_date_key(rec):
+    """Sort key for swim records by date, with missing dates last."""
+    date = rec.get("dateofswim") or rec.get("date_created")
+    return (date is None, date or "")
+
+
+# Output columns of the clean swimmer-times DataFrames, in order
+FASTEST_TIMES_COLUMNS = [
+    "swimmer_id", "event_label", "eventdistance", "eventcourse",
+    "eventstroke_name", "eventgender", "eventtime", "dateofswim",
+    "meet_name", "season_id",
+]
+ALL_TIMES_COLUMNS = FASTEST_TIMES_COLUMNS + ["heat", "lane", "place"]
+
+
 def getSwimmerAllTimes(swimmer_ID):
     """
     Fetch *all* swims for this swimmer across all events, using JSON APIs.
@@ -216,57 +386,53 @@ def getSwimmerAllTimes(swimmer_ID):
     import pandas as pd
 
     event_tokens = getSwimmerEventTokens(swimmer_ID)
-    all_rows = []
-
-    for et in event_tokens:
-        token = et["event_token"]
-        label = et["event_label"]
-        try:
-            event_times = getSwimmerTimesByEventJSON(swimmer_ID, token)
-        except Exception as e:
-            print(f"[SwimScraper] Error fetching times for swimmer {swimmer_ID}, "
-                  f"event {label} ({token}): {e}")
-            continue
-
-        for rec in event_times:
+    cols = {k: [] for k in ALL_TIMES_COLUMNS}
+    results = []
+
+    # One request per event; run them concurrently over the shared session.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {
+            ex.submit(getSwimmerTimesByEventJSON, swimmer_ID, et["event_token"]): et
+            for et in event_tokens
+        }
+        for fut in as_completed(futures):
+            et = futures[fut]
+            try:
+                results.append((et, fut.result()))
+            except Exception as e:
+                print(f"[SwimScraper] Error fetching times for swimmer {swimmer_ID}, "
+                      f"event {et['event_label']} ({et['event_token']}): {e}")
+
+    # Order by event, then date (undated swims last) before building the
+    # frame, so no DataFrame sort/copy is needed afterwards. Several tokens
+    # can share a label (it omits gender), so merge them per label in token
+    # order first; the stable date sort then gives a deterministic order.
+    token_order = {et["event_token"]: i for i, et in enumerate(event_tokens)}
+    results.sort(key=lambda r: (r[0]["event_label"], token_order[r[0]["event_token"]]))
+    for label, group in groupby(results, key=lambda r: r[0]["event_label"]):
+        records = [rec for _, event_times in group for rec in event_times]
+
+        for rec in sorted(records, key=_swim_date_key):
             # Choose sensible, stable fields; fall back where needed
-            distance = rec.get("eventdistance")
-            course = rec.get("eventcourse")
-            stroke_code = rec.get("eventstroke")
-            stroke_name = _stroke_name(stroke_code)
-            gender = rec.get("eventgender")
-
-            # time & date / meet fields (names inferred from fastest-times JSON)
-            eventtime = rec.get("eventtime") or rec.get("time")
-            dateofswim = rec.get("dateofswim") or rec.get("date_created")
-            meet_name = rec.get("meet_name") or rec.get("name")
-            season_id = rec.get("season_id")
-            heat = rec.get("heat")
-            lane = rec.get("lane")
-            place = rec.get("place")
-
-            all_rows.append({
-                "swimmer_id": swimmer_ID,
-                "event_label": label,
-                "eventdistance": distance,
-                "eventcourse": course,
-                "eventstroke_name": stroke_name,
-                "eventgender": gender,
-                "eventtime": eventtime,
-                "dateofswim": dateofswim,
-                "meet_name": meet_name,
-                "season_id": season_id,
-                "heat": heat,
-                "lane": lane,
-                "place": place,
-            })
-
-    if not all_rows:
+            # (time & date / meet names inferred from fastest-times JSON)
+            cols["swimmer_id"].append(swimmer_ID)
+            cols["event_label"].append(label)
+            cols["eventdistance"].append(rec.get("eventdistance"))
+            cols["eventcourse"].append(rec.get("eventcourse"))
+            cols["eventstroke_name"].append(_stroke_name(rec.get("eventstroke")))
+            cols["eventgender"].append(rec.get("eventgender"))
+            cols["eventtime"].append(rec.get("eventtime") or rec.get("time"))
+            cols["dateofswim"].append(rec.get("dateofswim") or rec.get("date_created"))
+            cols["meet_name"].append(rec.get("meet_name") or rec.get("name"))
+            cols["season_id"].append(rec.get("season_id"))
+            cols["heat"].append(rec.get("heat"))
+            cols["lane"].append(rec.get("lane"))
+            cols["place"].append(rec.get("place"))
+
+    if not cols["swimmer_id"]:
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_rows)
-    df = df.sort_values(["swimmer_id", "event_label", "dateofswim"], na_position="last")
-    return df
+    return pd.DataFrame(cols)
 
 def getSwimmerFastestTimesClean(swimmer_ID):
     """
@@ -279,27 +445,23 @@ def getSwimmerFastestTimesClean(swimmer_ID):
     import pandas as pd
 
     fastest = getSwimmerProfileFastestTimes(swimmer_ID)
-    rows = []
+    cols = {k: [] for k in FASTEST_TIMES_COLUMNS}
     for rec in fastest:
-        label = _event_label_from_record(rec)
-        stroke_name = _stroke_name(rec.get("eventstroke"))
-        rows.append({
-            "swimmer_id": swimmer_ID,
-            "event_label": label,
-            "eventdistance": rec.get("eventdistance"),
-            "eventcourse": rec.get("eventcourse"),
-            "eventstroke_name": stroke_name,
-            "eventgender": rec.get("eventgender"),
-            "eventtime": rec.get("eventtime") or rec.get("time"),
-            "dateofswim": rec.get("dateofswim") or rec.get("date_created"),
-            "meet_name": rec.get("meet_name") or rec.get("name"),
-            "season_id": rec.get("season_id"),
-        })
-
-    if not rows:
+        cols["swimmer_id"].append(swimmer_ID)
+        cols["event_label"].append(_event_label_from_record(rec))
+        cols["eventdistance"].append(rec.get("eventdistance"))
+        cols["eventcourse"].append(rec.get("eventcourse"))
+        cols["eventstroke_name"].append(_stroke_name(rec.get("eventstroke")))
+        cols["eventgender"].append(rec.get("eventgender"))
+        cols["eventtime"].append(rec.get("eventtime") or rec.get("time"))
+        cols["dateofswim"].append(rec.get("dateofswim") or rec.get("date_created"))
+        cols["meet_name"].append(rec.get("meet_name") or rec.get("name"))
+        cols["season_id"].append(rec.get("season_id"))
+
+    if not cols["swimmer_id"]:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(cols)
     df = df.sort_values(["swimmer_id", "event_label"])
     return df
 
@@ -350,18 +512,41 @@ def load_teams(path=None):
         if col not in df.columns:
             df[col] = None
 
-    return df[expected_cols]
+    # Few distinct values repeated across every team: store as categoricals
+    # (smaller table, and isin() filters compare integer codes).
+    return df[expected_cols].astype({
+        "team_state": "category",
+        "team_division": "category",
+        "team_conference": "category",
+    })
+
 
 
+def _index_teams(df):
+    """
+    Build lookup indexes over the teams table:
+      - name->ID and ID->name dicts (first row wins on duplicates)
+      - name/division/conference -> row positions, for getCollegeTeams()
+    """
+    global _name_to_id, _id_to_name, _rows_by_column
+    _name_to_id = dict(zip(df["team_name"][::-1], df["team_ID"][::-1]))
+    _id_to_name = dict(zip(df["team_ID"][::-1], df["team_name"][::-1]))
+    _rows_by_column = {
+        col: df.groupby(col, observed=True).indices
+        for col in ["team_name", "team_division", "team_conference"]
+    }
+
 
 # Global teams table used by a few helper functions
 teams = load_teams()
+_index_teams(teams)
 
 
 def set_teams_csv(path):
     """Override the default teams CSV path at runtime."""
     global teams
     teams = load_teams(path)
+    _index_teams(teams)
 
 
 # ---------------------------------------------------------------------------
@@ -464,6 +649,9 @@ events = {
     "400 L IM": "5400L",
 }
 
+# event_ID -> event_name, for O(1) reverse lookups in getEventName()
+_events_inverse = {v: k for k, v in events.items()}
+
 us_states = {
     "Alabama": "AL",
     "Alaska": "AK",
@@ -551,20 +739,12 @@ def cleanName(name: str) -> str:
 
 def getTeamID(team_name):
     """Get team_ID for a given team_name from the teams table."""
-    team_number = -1
-    for _, row in teams.iterrows():
-        if row["team_name"] == team_name:
-            team_number = row["team_ID"]
-    return team_number
+    return _name_to_id.get(team_name, -1)
 
 
 def getTeamName(team_ID):
     """Get team_name for a given team_ID from the teams table."""
-    team_name = ""
-    for _, row in teams.iterrows():
-        if row["team_ID"] == team_ID:
-            team_name = row["team_name"]
-    return team_name
+    return _id_to_name.get(team_ID, "")
 
 
 def getSeasonID(year):
@@ -576,25 +756,32 @@ def getYear(season_ID):
 
 
 def getEventName(event_ID):
-    return list(events.keys())[list(events.values()).index(event_ID)]
+    return _events_inverse.get(event_ID)
 
 
 def getEventID(event_name):
     return events.get(event_name)
 
 
+def _parse_hometown(hometown):
+    """Split 'City, ST' into (city, state) in one pass; state is 'NONE' if not alphabetic."""
+    city, _, state = hometown.rpartition(",")
+    state = state.strip()
+    if not state.isalpha():
+        state = "NONE"
+    if "," in city:
+        city = " ".join([c.strip() for c in city.split(",")])
+    else:
+        city = city.strip()
+    return city, state
+
+
 def getState(hometown):
-    home = hometown.split(",")[-1].strip()
-    if home.isalpha():
-        return home
-    return "NONE"
+    return _parse_hometown(hometown)[1]
 
 
 def getCity(hometown):
-    home = hometown.split(",")
-    home.pop()  # remove state/country
-    city = " ".join([c.strip() for c in home])
-    return city
+    return _parse_hometown(hometown)[0]
 
 
 def convertTime(display_time):
@@ -613,6 +800,25 @@ def convertTime(display_time):
         return float(display_time)
 
 
+def convert_times_vectorized(times):
+    """Vectorized convertTime() for a pandas Series of display times.
+
+    Returns a float Series of seconds; non-numeric codes (DNS/DQ) become NaN.
+    """
+    parts = (
+        pd.Series(times)
+        .astype(str)
+        .str.strip()
+        .str.split(":", n=1, expand=True)
+        .reindex(columns=[0, 1])
+    )
+    has_colon = parts[1].notna()
+    minutes = pd.to_numeric(parts[0].where(has_colon), errors="coerce")
+    seconds = pd.to_numeric(parts[1].where(has_colon), errors="coerce")
+    plain = pd.to_numeric(parts[0].where(~has_colon), errors="coerce")
+    return (minutes * 60 + seconds).fillna(plain).astype("float64")
+
+
 def getIndexes(data):
     """For EVENT PROGRESSION tables; find meet / date / extra-info columns."""
     meet_name_index = -1
@@ -652,19 +858,48 @@ def getCollegeTeams(team_names=["NONE"], conference_names=["NONE"], division_nam
     This uses collegeSwimmingTeams.csv (loaded into `teams`) – it does NOT
     hit SwimCloud directly. Use getTeamList.py to regenerate the CSV if needed.
     """
-    team_df = pd.DataFrame()
     if team_names != ["NONE"]:
-        team_df = teams[teams["team_name"].isin(team_names)].reset_index(drop=True)
+        col, names = "team_name", team_names
     elif division_names != ["NONE"]:
-        team_df = teams[teams["team_division"].isin(division_names)].reset_index(drop=True)
+        col, names = "team_division", division_names
     elif conference_names != ["NONE"]:
-        team_df = teams[teams["team_conference"].isin(conference_names)].reset_index(
-            drop=True
-        )
+        col, names = "team_conference", conference_names
     else:
-        team_df = teams
+        return teams.to_dict("records")
+
+    # Pull matching row positions from the prebuilt index instead of
+    # scanning the whole table; np.unique keeps table order, no duplicates.
+    index = _rows_by_column[col]
+    matches = [index[name] for name in names if name in index]
+    if not matches:
+        return []
+    rows = np.unique(np.concatenate(matches))
+    return teams.iloc[rows].to_dict("records")
 
-    return team_df.to_dict("records")
+
+def _has_classes(*names):
+    """
+    Class filter for a SoupStrainer. At parse time bs4 hands the strainer
+    the raw class string, so match on its tokens rather than the whole
+    string (extra classes on the element must not break the match).
+    """
+    wanted = set(names)
+
+    def match(value):
+        if value is None:
+            return False
+        tokens = value.split() if isinstance(value, str) else value
+        return wanted.issubset(tokens)
+
+    return match
+
+
+# Only build the DOM for the table we read (skips head, scripts, sidebars)
+_ROSTER_TABLE = SoupStrainer(
+    "table",
+    class_=_has_classes("c-table-clean", "c-table-clean--middle", "table", "table-hover"),
+)
+_RECRUIT_TABLE = SoupStrainer("div", class_=_has_classes("c-table-clean--responsive"))
 
 
 def getRoster(team, gender, team_ID=-1, season_ID=-1, year=-1, pro=False):
@@ -703,7 +938,7 @@ def getRoster(team, gender, team_ID=-1, season_ID=-1, year=-1, pro=False):
         f"?page=1&gender={gender}&season_id={season_ID}"
     )
 
-    resp = requests.get(
+    resp = _SESSION.get(
         roster_url,
         headers={
             "User-Agent": (
@@ -712,34 +947,27 @@ def getRoster(team, gender, team_ID=-1, season_ID=-1, year=-1, pro=False):
                 " Chrome/81.0.4044.138 Safari/537.36"
             ),
             "Referer": "https://google.com/",
+            # override the session's JSON Accept header for HTML pages
+            "Accept": "*/*",
         },
     )
     resp.encoding = "utf-8"
-    soup = bs(resp.text, "html.parser")
+    soup = bs(resp.text, "lxml", parse_only=_ROSTER_TABLE)
 
     try:
-        rows = (
-            soup.find(
-                "table",
-                attrs={
-                    "class": "c-table-clean c-table-clean--middle table table-hover"
-                },
-            )
-            .find_all("tr")[1:]
-        )
+        rows = soup.find("table").find_all("tr")[1:]
     except AttributeError:
         print("An invalid team was entered, causing the following error:")
         raise
 
     for row in rows:
-        swimmer_name = cleanName(row.find("a").text.strip())
-        id_array = row.find_all("a")
-        swimmer_ID = id_array[0]["href"].split("/")[-1]
+        # first link in the row is the swimmer profile: name + ID
+        swimmer_link = row.find("a")
+        swimmer_name = cleanName(swimmer_link.text.strip())
+        swimmer_ID = swimmer_link["href"].split("/")[-1]
 
-        cols = row.find_all("td")
-        hometown = cols[2].text.strip()
-        state = getState(hometown)
-        city = getCity(hometown)
+        cols = row.find_all("td", recursive=False)
+        city, state = _parse_hometown(cols[2].text.strip())
 
         if not pro:
             grade = cols[3].text.strip()
@@ -765,6 +993,98 @@ def getRoster(team, gender, team_ID=-1, season_ID=-1, year=-1, pro=False):
     return roster
 
 
+# Browser-like headers for SwimCloud HTML pages
+HTML_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.6367.60 Safari/537.36"
+    ),
+    "Referer": "https://www.google.com/",
+    "Accept": "*/*",
+}
+
+# CSS selectors compiled once instead of per-row lambda href filters
+_SWIMMER_LINK = sv.compile('a[href*="/swimmer/"]')
+_TEAM_LINK = sv.compile('a[href*="/team/"]')
+
+
+def _parse_recruit_page(resp):
+    """
+    Parse one recruiting rankings page into recruit dicts.
+
+    Returns None when the page is missing or has no ranking rows, which
+    ends pagination.
+    """
+    if resp.status_code != 200:
+        return None
+
+    # hand lxml the raw bytes: no decoded str copy of each page
+    soup = bs(resp.content, "lxml", parse_only=_RECRUIT_TABLE)
+    table_div = soup.find("div", class_="c-table-clean--responsive")
+    if not table_div:
+        return None
+
+    rows = table_div.find_all("tr")
+    if len(rows) <= 1:
+        return None
+
+    recruits = []
+    for row in rows[1:]:
+        # swimmer name + ID
+        name_link = _SWIMMER_LINK.select_one(row)
+        if not name_link:
+            continue
+        swimmer_name = name_link.get_text(strip=True)
+        href = name_link["href"].rstrip("/")
+        swimmer_ID = href.split("/")[-1]
+
+        # hometown info
+        hometown_state = hometown_city = None
+        hometown_td = row.find("td", class_="u-color-mute")
+        if hometown_td:
+            hometown_city, hometown_state = _parse_hometown(
+                hometown_td.get_text(strip=True)
+            )
+
+        # HS power index (as shown in table)
+        hs_power_index = None
+        power_td = row.find("td", class_="u-text-end")
+        if power_td:
+            hs_power_index = power_td.get_text(strip=True)
+
+        # committed college (if any)
+        team_name = "None"
+        team_ID = "None"
+        team_link = _TEAM_LINK.select_one(row)
+        if team_link:
+            team_href = team_link["href"].rstrip("/")
+            team_ID = team_href.split("/")[-1]
+
+            img = team_link.find("img")
+            if img and img.get("alt"):
+                parts = img["alt"].split()
+                if parts and parts[-1].lower() == "logo":
+                    parts = parts[:-1]
+                team_name = " ".join(parts).strip() or team_name
+            else:
+                team_name = team_link.get_text(strip=True) or team_name
+
+        recruits.append(
+            {
+                "swimmer_name": swimmer_name,
+                "swimmer_ID": swimmer_ID,
+                "team_name": team_name,
+                "team_ID": team_ID,
+                "hometown_state": hometown_state,
+                "hometown_city": hometown_city,
+                "HS_power_index": hs_power_index,
+            }
+        )
+
+    return recruits
+
+
 def getHSRecruitRankings(
     class_year, gender, state="none", state_abbreviation="none", international=False
 ):
@@ -775,8 +1095,6 @@ def getHSRecruitRankings(
       swimmer_name, swimmer_ID, team_name, team_ID,
       hometown_state, hometown_city, HS_power_index
     """
-    recruits = []
-
     if state != "none" and state_abbreviation == "none":
         state_abbreviation = us_states.get(state)
 
@@ -795,98 +1113,36 @@ def getHSRecruitRankings(
     else:
         recruiting_url = base
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.6367.60 Safari/537.36"
-        ),
-        "Referer": "https://www.google.com/",
-    }
-
-    for page in range(1, 5):
-        page_url = f"{recruiting_url}?page={page}"
-        resp = requests.get(page_url, headers=headers)
-        if resp.status_code != 200:
-            break
+    # Page 1 tells us whether there is anything to page through; only then
+    # fetch the remaining pages concurrently and parse them in order,
+    # stopping at the first bad/empty page as before.
+    page_urls = [f"{recruiting_url}?page={page}" for page in range(1, 5)]
+    recruits = _parse_recruit_page(_SESSION.get(page_urls[0], headers=HTML_HEADERS))
+    if recruits is None:
+        return []
 
-        soup = bs(resp.text, "html.parser")
-        table_div = soup.find("div", class_="c-table-clean--responsive")
-        if not table_div:
-            break
+    with ThreadPoolExecutor(max_workers=len(page_urls) - 1) as ex:
+        responses = list(
+            ex.map(lambda url: _SESSION.get(url, headers=HTML_HEADERS), page_urls[1:])
+        )
 
-        rows = table_div.find_all("tr")
-        if len(rows) <= 1:
+    for resp in responses:
+        page_recruits = _parse_recruit_page(resp)
+        if page_recruits is None:
             break
-
-        for row in rows[1:]:
-            # swimmer name + ID
-            name_link = row.find("a", href=lambda h: h and "/swimmer/" in h)
-            if not name_link:
-                continue
-            swimmer_name = name_link.get_text(strip=True)
-            href = name_link["href"].rstrip("/")
-            swimmer_ID = href.split("/")[-1]
-
-            # hometown info
-            hometown_state = hometown_city = None
-            hometown_td = row.find("td", class_="u-color-mute")
-            if hometown_td:
-                hometown_info = hometown_td.get_text(strip=True)
-                hometown_state = getState(hometown_info)
-                hometown_city = getCity(hometown_info)
-
-            # HS power index (as shown in table)
-            hs_power_index = None
-            power_td = row.find("td", class_="u-text-end")
-            if power_td:
-                hs_power_index = power_td.get_text(strip=True)
-
-            # committed college (if any)
-            team_name = "None"
-            team_ID = "None"
-            team_link = row.find("a", href=lambda h: h and "/team/" in h)
-            if team_link:
-                team_href = team_link["href"].rstrip("/")
-                team_ID = team_href.split("/")[-1]
-
-                img = team_link.find("img")
-                if img and img.get("alt"):
-                    parts = img["alt"].split()
-                    if parts and parts[-1].lower() == "logo":
-                        parts = parts[:-1]
-                    team_name = " ".join(parts).strip() or team_name
-                else:
-                    team_name = team_link.get_text(strip=True) or team_name
-
-            recruits.append(
-                {
-                    "swimmer_name": swimmer_name,
-                    "swimmer_ID": swimmer_ID,
-                    "team_name": team_name,
-                    "team_ID": team_ID,
-                    "hometown_state": hometown_state,
-                    "hometown_city": hometown_city,
-                    "HS_power_index": hs_power_index,
-                }
-            )
+        recruits.extend(page_recruits)
 
     return recruits
 
 
 # ---------------------------------------------------------------------------
-# LEGACY / HEAVY FUNCTIONS (HTML + Selenium)
+# LEGACY FUNCTIONS
 # ---------------------------------------------------------------------------
 # These are left mostly unchanged for backwards compatibility but are NOT
 # used in your new JSON+HTML pipeline. Use with caution for big jobs.
 
 def getTeamRankingsList(gender, season_ID=-1, year=-1):
-    """Legacy: scrape national team rankings with Selenium."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    driver = webdriver.Chrome(options=chrome_options)
-    ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)
-
+    """Legacy: scrape national team rankings (server-rendered HTML)."""
     teams_out = []
 
     if gender not in ("M", "F"):
@@ -899,15 +1155,19 @@ def getTeamRankingsList(gender, season_ID=-1, year=-1):
         current_year = datetime.now().year
         season_ID = getSeasonID(current_year)
 
-    page_url = (
-        "https://swimcloud.com/team/rankings/?eventCourse=L"
-        f"?gender={gender}&page=1&region&seasonId={season_ID}"
+    resp = _SESSION.get(
+        "https://www.swimcloud.com/team/rankings/",
+        params={
+            "eventCourse": "L",
+            "gender": gender,
+            "page": 1,
+            "region": "",
+            "seasonId": season_ID,
+        },
+        headers=HTML_HEADERS,
     )
-    driver.get(page_url)
-    _time.sleep(3)
-
-    html = driver.page_source
-    soup = bs(html, "html.parser")
+    resp.raise_for_status()
+    soup = bs(resp.content, "lxml")
 
     teams_list = (
         soup.find("table", attrs={"class": "c-table-clean"})
@@ -928,7 +1188,6 @@ def getTeamRankingsList(gender, season_ID=-1, year=-1):
             }
         )
 
-    driver.close()
     return teams_out
 
 
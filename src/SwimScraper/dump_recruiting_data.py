@@ -8,16 +8,20 @@ Batch script to build a roster dataset for selected teams and years.
   calls SwimScraper.getRoster(...)
 - Writes:
     - teams.csv   (unique teams from the config)
-    - rosters.csv (one row per swimmer-season)
+    - rosters.csv (one row per swimmer-season, streamed as rosters arrive)
 """
 
 import csv
+import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict
 
 import pandas as pd
 
+import http_cache
 import SwimScraper as ss
+from memory_helpers import reduce_memory
 
 # ---------------------------------------------------------------------
 # CONFIG
@@ -34,6 +38,14 @@ OUTPUT_ROSTERS_CSV = Path(__file__).with_name("rosters.csv")
 START_YEAR = 2020
 END_YEAR = 2024
 
+# Number of rosters fetched concurrently
+MAX_WORKERS = 16
+
+# Re-sort rosters.csv (team, gender, year, swimmer) after streaming it out.
+# Off by default: rows are written in completion order to avoid holding the
+# whole dataset in memory.
+SORT_ROSTERS = False
+
 
 # ---------------------------------------------------------------------
 # HELPERS
@@ -43,6 +55,9 @@ def read_team_config(path: Path = CONFIG_PATH) -> List[Dict]:
     """
     Read teams_config.csv and return a list of dicts with keys:
       team_id, team_name, gender
+
+    The validated list is pickled next to the CSV and reused while the
+    pickle is at least as new as the CSV, skipping the parse on reruns.
     """
     if not path.exists():
         raise FileNotFoundError(
@@ -50,6 +65,22 @@ def read_team_config(path: Path = CONFIG_PATH) -> List[Dict]:
             "Create it with columns: team_id,team_name,gender"
         )
 
+    cache_path = path.with_suffix(".pkl")
+    if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+        with cache_path.open("rb") as f:
+            return pickle.load(f)
+
+    teams = _parse_team_config(path)
+    try:
+        with cache_path.open("wb") as f:
+            pickle.dump(teams, f, protocol=5)
+    except OSError as e:
+        print(f"[WARN] Could not write config cache {cache_path}: {e}")
+    return teams
+
+
+def _parse_team_config(path: Path) -> List[Dict]:
+    """Parse and validate teams_config.csv (no caching)."""
     teams = []
     with path.open(newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -88,74 +119,100 @@ def write_teams_csv(teams: List[Dict], path: Path = OUTPUT_TEAMS_CSV) -> None:
     """
     Write a simple teams.csv with unique (team_id, team_name).
     """
-    uniq = {}
-    for t in teams:
-        uniq[t["team_id"]] = t["team_name"]
+    uniq = {t["team_id"]: t["team_name"] for t in teams}
+    rows = sorted(uniq.items(), key=lambda kv: (kv[1], kv[0]))
 
-    rows = [{"team_id": k, "team_name": v} for k, v in uniq.items()]
-    df = pd.DataFrame(rows).sort_values(["team_name", "team_id"])
-    df.to_csv(path, index=False, encoding="utf-8")
-    print(f"[dump_recruiting_data] Wrote {len(df)} teams to {path}")
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")  # match pandas' to_csv output
+        writer.writerow(["team_id", "team_name"])
+        writer.writerows(rows)
+    print(f"[dump_recruiting_data] Wrote {len(rows)} teams to {path}")
 
 
 # ---------------------------------------------------------------------
 # MAIN ROSTER DUMP LOGIC
 # ---------------------------------------------------------------------
 
-def gather_rosters(team_config: List[Dict]) -> pd.DataFrame:
-    """
-    Loop over team_config and years, call getRoster, and accumulate results
-    into a single pandas DataFrame.
+def gather_rosters(team_config: List[Dict], path: Path = OUTPUT_ROSTERS_CSV) -> int:
     """
-    all_rows = []
-
-    for cfg in team_config:
-        team_id = cfg["team_id"]
-        team_name = cfg["team_name"]
-        gender = cfg["gender"]
+    Loop over team_config and years, call getRoster, and stream every
+    roster row straight into the rosters CSV at `path`.
 
-        for year in range(START_YEAR, END_YEAR + 1):
-            print(f"Fetching roster for {team_name} ({gender}), year {year}...")
-
-            try:
-                roster = ss.getRoster(
+    The file is only created once the first roster arrives, so a run that
+    collects nothing leaves any previous CSV in place. Returns the number
+    of rows written.
+    """
+    jobs = [
+        (cfg["team_id"], cfg["team_name"], cfg["gender"], year)
+        for cfg in team_config
+        for year in range(START_YEAR, END_YEAR + 1)
+    ]
+    print(f"Fetching {len(jobs)} rosters ({MAX_WORKERS} at a time)...")
+
+    f = None
+    writer = None
+    n_rows = 0
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    ss.getRoster,
                     team=team_name,
                     gender=gender,
                     year=year,
                     team_ID=team_id,
-                )
-            except Exception as e:
-                print(
-                    f"[ERROR] Failed to fetch roster for {team_name} ({gender}), "
-                    f"year {year}: {e}"
-                )
-                continue
-
-            if not roster:
-                print(
-                    f"[WARN] No roster rows returned for {team_name} ({gender}), "
-                    f"year {year}"
-                )
-                continue
-
-            # Add year info to each row
-            for r in roster:
-                r = dict(r)  # copy
-                r["year"] = year
-                all_rows.append(r)
-
-    if not all_rows:
+                ): (team_name, gender, year)
+                for team_id, team_name, gender, year in jobs
+            }
+
+            for future in as_completed(futures):
+                team_name, gender, year = futures[future]
+
+                try:
+                    roster = future.result()
+                except Exception as e:
+                    print(
+                        f"[ERROR] Failed to fetch roster for {team_name} ({gender}), "
+                        f"year {year}: {e}"
+                    )
+                    continue
+
+                if not roster:
+                    print(
+                        f"[WARN] No roster rows returned for {team_name} ({gender}), "
+                        f"year {year}"
+                    )
+                    continue
+
+                print(f"Fetched roster for {team_name} ({gender}), year {year}")
+
+                if writer is None:
+                    f = path.open("w", newline="", encoding="utf-8", buffering=1 << 20)
+                    writer = csv.DictWriter(f, fieldnames=list(roster[0].keys()) + ["year"])
+                    writer.writeheader()
+
+                # Add year info to each row. getRoster builds fresh dicts per
+                # call, so tag them in place rather than copying each one.
+                for r in roster:
+                    r["year"] = year
+                writer.writerows(roster)
+                n_rows += len(roster)
+    finally:
+        if f is not None:
+            f.close()
+
+    if not n_rows:
         print("[dump_recruiting_data] WARNING: No roster rows collected.")
-        return pd.DataFrame()
 
-    df = pd.DataFrame(all_rows)
+    return n_rows
 
-    # Optional: sort rows for nicer CSV output
+
+def sort_rosters_csv(path: Path = OUTPUT_ROSTERS_CSV) -> None:
+    """Re-sort a written rosters CSV by team, gender, year and swimmer name."""
+    df = reduce_memory(pd.read_csv(path))
     sort_cols = [c for c in ["team_name", "gender", "year", "swimmer_name"] if c in df.columns]
     if sort_cols:
-        df = df.sort_values(sort_cols)
-
-    return df
+        df.sort_values(sort_cols).to_csv(path, index=False, encoding="utf-8")
 
 
 def main():
@@ -166,17 +223,19 @@ def main():
     # Write simple teams.csv
     write_teams_csv(team_config, OUTPUT_TEAMS_CSV)
 
-    # Gather rosters
-    roster_df = gather_rosters(team_config)
+    # Gather rosters (written to disk as they arrive)
+    n_rows = gather_rosters(team_config, OUTPUT_ROSTERS_CSV)
 
-    if roster_df.empty:
+    if not n_rows:
         print("[dump_recruiting_data] No roster data to write.")
-    else:
-        roster_df.to_csv(OUTPUT_ROSTERS_CSV, index=False, encoding="utf-8")
-        print(
-            f"[dump_recruiting_data] Wrote {len(roster_df)} rows to {OUTPUT_ROSTERS_CSV}"
-        )
+        return
+
+    if SORT_ROSTERS:
+        sort_rosters_csv(OUTPUT_ROSTERS_CSV)
+    print(f"[dump_recruiting_data] Wrote {n_rows} rows to {OUTPUT_ROSTERS_CSV}")
 
 
 if __name__ == "__main__":
+    if http_cache.install():
+        ss.set_session(ss._build_session())
     main()
@@ -1,5 +1,6 @@
 # dump_recruits_2028.py
-import pandas as pd
+import csv
+import http_cache
 import SwimScraper as ss
 
 CLASS_YEAR = 2028
@@ -7,6 +8,14 @@ GENDERS = ["M", "F"]
 OUT_CSV = "recruits_2028.csv"
 
 
+def _to_float(value):
+    """Like pd.to_numeric(errors="coerce") for one value; None becomes an empty cell."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def main():
     all_rows = []
 
@@ -24,12 +33,18 @@ def main():
         print("No recruits found.")
         return
 
-    df = pd.DataFrame(all_rows)
     # Ensure HS_power_index is numeric for later analysis
-    df["HS_power_index"] = pd.to_numeric(df["HS_power_index"], errors="coerce")
-    df.to_csv(OUT_CSV, index=False, encoding="utf-8")
-    print(f"Wrote {len(df)} rows to {OUT_CSV}")
+    for r in all_rows:
+        r["HS_power_index"] = _to_float(r["HS_power_index"])
+
+    with open(OUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(all_rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(all_rows)
+    print(f"Wrote {len(all_rows)} rows to {OUT_CSV}")
 
 
 if __name__ == "__main__":
+    if http_cache.install():
+        ss.set_session(ss._build_session())
     main()
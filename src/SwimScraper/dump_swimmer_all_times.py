@@ -2,21 +2,47 @@
 dump_swimmer_all_times.py
 
 Read swimmer IDs (from rosters.csv) and dump *all* swims for all events
-for each swimmer to swimmer_all_times.csv using JSON APIs.
+for each swimmer using JSON APIs.
+
+Writes swimmer_all_times.parquet (zstd, needs pyarrow) by default, or
+swimmer_all_times.csv with --format csv. Falls back to CSV when pyarrow
+is not installed.
 """
 
+import argparse
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import pandas as pd
+import http_cache
 import SwimScraper as ss
 
 ROSTERS_CSV = Path(__file__).with_name("rosters.csv")
 OUT_CSV = Path(__file__).with_name("swimmer_all_times.csv")
+OUT_PARQUET = OUT_CSV.with_suffix(".parquet")
+
+# Parquet column types are fixed up front: a single swimmer's frame can have
+# all-null columns, so inferring the schema from the first frame is unsafe.
+# "place" stays a string: results such as "DQ" are not numbers.
+NUMERIC_COLUMNS = ["eventdistance", "season_id", "heat", "lane"]
+
+# Swimmers fetched concurrently. Each getSwimmerAllTimes call already runs
+# ss.MAX_WORKERS event requests in parallel, so keep the product within the
+# shared session's connection pool.
+MAX_WORKERS = 4
 
 
 def load_swimmer_ids(path=ROSTERS_CSV):
-    df = pd.read_csv(path)
+    # Only parse the one column we need, as strings (no dtype inference).
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c == "swimmer_ID",
+        dtype={"swimmer_ID": "string"},
+        engine="c",
+    )
     if "swimmer_ID" not in df.columns:
-        raise ValueError(f"rosters.csv missing 'swimmer_ID' column (found: {df.columns})")
+        found = pd.read_csv(path, nrows=0).columns
+        raise ValueError(f"rosters.csv missing 'swimmer_ID' column (found: {found})")
 
     ids = (
         df["swimmer_ID"]
@@ -27,34 +53,125 @@ def load_swimmer_ids(path=ROSTERS_CSV):
     return ids
 
 
-def main():
+def iter_swimmer_frames(swimmer_ids):
+    """Fetch swimmers concurrently and yield each non-empty DataFrame as it completes."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(ss.getSwimmerAllTimes, sid): sid for sid in swimmer_ids
+        }
+        for i, future in enumerate(as_completed(futures), start=1):
+            sid = futures[future]
+            prefix = f"  [{i}/{len(swimmer_ids)}] Swimmer {sid}..."
+            try:
+                df = future.result()
+            except Exception as e:
+                print(f"{prefix} ERROR: {e}")
+                continue
+
+            if df.empty:
+                print(f"{prefix} no data")
+                continue
+
+            print(f"{prefix} {len(df)} rows")
+            yield df
+
+
+def write_csv(frames, path=OUT_CSV):
+    """
+    Append each frame to a CSV as it arrives instead of holding every frame
+    for one big concat. The file is only opened once there is data, so an
+    empty run leaves it untouched. Returns the number of rows written.
+    """
+    f = None
+    n_rows = 0
+    try:
+        for df in frames:
+            if f is None:
+                f = path.open("w", newline="", encoding="utf-8")
+            df.to_csv(f, index=False, header=(n_rows == 0))
+            n_rows += len(df)
+    finally:
+        if f is not None:
+            f.close()
+    return n_rows
+
+
+def write_parquet(frames, path=OUT_PARQUET):
+    """Stream frames into a zstd-compressed Parquet file; returns rows written."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (c, pa.float64() if c in NUMERIC_COLUMNS else pa.string())
+        for c in ss.ALL_TIMES_COLUMNS
+    ])
+
+    writer = None
+    n_rows = 0
+    try:
+        for df in frames:
+            df = df.reindex(columns=ss.ALL_TIMES_COLUMNS)
+            for c in df.columns:
+                if c in NUMERIC_COLUMNS:
+                    numeric = pd.to_numeric(df[c], errors="coerce").astype("float64")
+                    dropped = df[c][numeric.isna() & df[c].notna()]
+                    if not dropped.empty:
+                        print(
+                            f"[dump_swimmer_all_times] WARN: {len(dropped)} non-numeric "
+                            f"{c!r} value(s) written as null: {sorted(set(map(str, dropped)))[:10]}"
+                        )
+                    df[c] = numeric
+                else:
+                    df[c] = df[c].astype("string")
+
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    path, schema, compression="zstd", compression_level=3
+                )
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+            n_rows += len(df)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n_rows
+
+
+def main(fmt="parquet"):
     swimmer_ids = load_swimmer_ids()
     print(f"[dump_swimmer_all_times] Loaded {len(swimmer_ids)} unique swimmers")
 
-    all_dfs = []
-    for i, sid in enumerate(swimmer_ids, start=1):
-        print(f"  [{i}/{len(swimmer_ids)}] Swimmer {sid}...", end="", flush=True)
-        try:
-            df = ss.getSwimmerAllTimes(sid)
-        except Exception as e:
-            print(f" ERROR: {e}")
-            continue
-
-        if df.empty:
-            print(" no data")
-            continue
+    if fmt == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        print(
+            "[dump_swimmer_all_times] pyarrow not installed "
+            "(pip install SwimScraper[parquet]); writing CSV instead."
+        )
+        fmt = "csv"
 
-        all_dfs.append(df)
-        print(f" {len(df)} rows")
+    frames = iter_swimmer_frames(swimmer_ids)
+    if fmt == "csv":
+        out_path = OUT_CSV
+        n_rows = write_csv(frames, out_path)
+    else:
+        out_path = OUT_PARQUET
+        n_rows = write_parquet(frames, out_path)
 
-    if not all_dfs:
+    if not n_rows:
         print("[dump_swimmer_all_times] No data collected.")
         return
 
-    out = pd.concat(all_dfs, ignore_index=True)
-    out.to_csv(OUT_CSV, index=False, encoding="utf-8")
-    print(f"[dump_swimmer_all_times] Wrote {len(out)} rows to {OUT_CSV}")
+    print(f"[dump_swimmer_all_times] Wrote {n_rows} rows to {out_path}")
 
 
 if __name__ == "__main__":
-    main()
+    if http_cache.install():
+        ss.set_session(ss._build_session())
+    parser = argparse.ArgumentParser(
+        description="Dump all swims for every swimmer in rosters.csv."
+    )
+    parser.add_argument(
+        "--format",
+        choices=["parquet", "csv"],
+        default="parquet",
+        help="output format (default: parquet; csv if pyarrow is missing)",
+    )
+    main(parser.parse_args().format)
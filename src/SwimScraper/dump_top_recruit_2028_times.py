@@ -6,6 +6,7 @@
 # 4. Save to top_recruit_2028_all_times.csv
 
 import pandas as pd
+import http_cache
 import SwimScraper as ss
 
 
@@ -15,7 +16,9 @@ OUT_CSV = "top_recruit_2028_all_times.csv"
 
 def pick_top_recruit(path: str) -> tuple[str, str]:
     """Return (swimmer_id, swimmer_name) for the best recruit."""
-    df = pd.read_csv(path)
+    df = pd.read_csv(
+        path, usecols=lambda c: c in {"swimmer_ID", "swimmer_name", "HS_power_index"}
+    )
 
     if "HS_power_index" not in df.columns or "swimmer_ID" not in df.columns:
         raise ValueError("recruits_2028.csv must have HS_power_index and swimmer_ID columns")
@@ -27,8 +30,7 @@ def pick_top_recruit(path: str) -> tuple[str, str]:
     if df.empty:
         raise ValueError("No recruits with a valid HS_power_index found.")
 
-    df = df.sort_values("HS_power_index")
-    top = df.iloc[0]
+    top = df.loc[df["HS_power_index"].idxmin()]
 
     swimmer_id = str(top["swimmer_ID"])
     swimmer_name = str(top["swimmer_name"])
@@ -59,4 +61,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if http_cache.install():
+        ss.set_session(ss._build_session())
     main()
@@ -1,4 +1,5 @@
-import pandas as pd
+import csv
+import http_cache
 import SwimScraper as ss
 
 TEAM_ID = 117
@@ -24,10 +25,14 @@ def main():
         print("No roster data found.")
         return
 
-    df = pd.DataFrame(all_rows)
-    df.to_csv(OUT_CSV, index=False, encoding="utf-8")
-    print(f"Wrote {len(df)} rows to {OUT_CSV}")
+    with open(OUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(all_rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(all_rows)
+    print(f"Wrote {len(all_rows)} rows to {OUT_CSV}")
 
 
 if __name__ == "__main__":
+    if http_cache.install():
+        ss.set_session(ss._build_session())
     main()
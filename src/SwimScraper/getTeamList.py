@@ -1,12 +1,19 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
-from bs4 import BeautifulSoup as bs
+import os
+from lxml import etree, html
 import pandas as pd
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union
 
 TEAM_PAGE_RANGE = 32  # number of pages under /team/?page=
+MAX_CONCURRENT_PAGES = 8  # cap on in-flight page requests
+MAX_REQUESTS_PER_SECOND = 20  # overall request budget, to be polite to the server
 
 states = [
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DC", "DE", "FL", "GA",
@@ -16,119 +23,221 @@ states = [
     "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
 ]
 
-team_list = []
 
+class _RateLimiter:
+    """Thread-safe token bucket: up to max_rate requests per period, bursts allowed."""
+
+    def __init__(self, max_rate, period=1.0):
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.max_rate / self.period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.max_rate
+            time.sleep(wait)
+
+
+_LIMITER = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def _build_session():
+    """Session with keep-alive pooling sized for the concurrent page fetches."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    # raise_on_status=False: a page that keeps failing comes back as its last
+    # response (parsed as no teams) instead of raising RetryError
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_PAGES,
+            pool_maxsize=MAX_CONCURRENT_PAGES,
+            max_retries=retries,
+        ),
+    )
+    return session
+
+
+# Shared across scrapes so repeated calls reuse the same TLS connections
+_SESSION = _build_session()
+
+
+def set_session(session):
+    """Replace the shared requests.Session (e.g. a cached one)."""
+    global _SESSION
+    _SESSION = session
+
+
+# Column order of the teams table / collegeSwimmingTeams.csv
+TEAM_FIELDS = [
+    "team_name",
+    "team_ID",
+    "team_state",
+    "team_division",
+    "team_division_ID",
+    "team_conference",
+    "team_conference_ID",
+]
 
-def getTeamList():
+
+def _fetch_team_page(session, page):
+    """Download one /team/?page=N listing page and return its raw HTML bytes."""
+    _LIMITER.acquire()
+    resp = session.get(f"https://www.swimcloud.com/team/?page={page}")
+    return resp.content
+
+
+# Compiled once; the equivalent of soup.find_all("tr")[1:] (first row is header)
+_TEAM_ROWS = etree.XPath("(//tr)[position() > 1]")
+_CELLS = etree.XPath("./td")
+_FIRST_LINK = etree.XPath("(.//a)[1]")
+# SwimCloud serves UTF-8; without a <meta charset> lxml would assume Latin-1
+_HTML_PARSER = html.HTMLParser(encoding="utf-8")
+
+
+def _first_link(cell):
+    links = _FIRST_LINK(cell)
+    return links[0] if links else None
+
+
+def _parse_team_page(content):
+    """Parse one /team/ listing page into a list of team dicts."""
+    teams = []
+    if not content:
+        return teams
+    doc = html.fromstring(content, parser=_HTML_PARSER)
+
+    for row in _TEAM_ROWS(doc):
+        infoList = _CELLS(row)
+        if len(infoList) < 4:
+            continue
+
+        team_link = _first_link(infoList[0])
+        team_name = team_link.text_content().strip()
+        team_ID = team_link.attrib["href"].split("/")[-2]
+
+        team_state = infoList[1].text_content().strip()
+        if team_state not in states:
+            team_state = "NA"
+
+        team_division = "NONE"
+        team_division_ID = "NONE"
+        team_conference = "NONE"
+        team_conference_ID = "NONE"
+
+        div_link = _first_link(infoList[2])
+        if div_link is not None:
+            team_division = div_link.attrib["title"].strip()
+            team_division_ID = div_link.attrib["href"].split("/")[-2]
+
+        conf_link = _first_link(infoList[3])
+        if conf_link is not None:
+            team_conference = conf_link.attrib["title"].strip()
+            team_conference_ID = conf_link.attrib["href"].split("/")[-2]
+
+        teams.append(
+            {
+                "team_name": team_name,
+                "team_ID": team_ID,
+                "team_state": team_state,
+                "team_division": team_division,
+                "team_division_ID": team_division_ID,
+                "team_conference": team_conference,
+                "team_conference_ID": team_conference_ID,
+            }
+        )
+
+    return teams
+
+
+def iter_teams():
     """
-    Scrape SwimCloud's /team/ pages to get all college teams.
+    Scrape SwimCloud's /team/ pages and yield one college team dict at a time.
 
     This is an HTML-only "surface" scraper used to build collegeSwimmingTeams.csv.
+    Pages are fetched concurrently (at most MAX_CONCURRENT_PAGES in flight)
+    and yielded in page order, so callers can stream rows without holding
+    the whole team list.
     """
-    global team_list
-    team_list = []
-
-    for page in range(1, TEAM_PAGE_RANGE):
-        team_list_url = f"https://www.swimcloud.com/team/?page={page}"
-        resp = requests.get(
-            team_list_url,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
+    session = _SESSION
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as ex:
+        pages = ex.map(
+            lambda page: _fetch_team_page(session, page),
+            range(1, TEAM_PAGE_RANGE),
         )
-        resp.encoding = "utf-8"
-        soup = bs(resp.content, "html.parser")
-
-        teams_html = soup.find_all("tr")[1:]  # first row is header
-
-        for row in teams_html:
-            infoList = row.find_all("td")
-            if len(infoList) < 4:
-                continue
-
-            team_name = infoList[0].find("a").text.strip()
-            team_ID = infoList[0].find("a")["href"].split("/")[-2]
-
-            team_state = infoList[1].text.strip()
-            if team_state not in states:
-                team_state = "NA"
-
-            team_division = "NONE"
-            team_division_ID = "NONE"
-            team_conference = "NONE"
-            team_conference_ID = "NONE"
-
-            if infoList[2].find("a") is not None:
-                div_link = infoList[2].find("a")
-                team_division = div_link["title"].strip()
-                team_division_ID = div_link["href"].split("/")[-2]
-
-            if infoList[3].find("a") is not None:
-                conf_link = infoList[3].find("a")
-                team_conference = conf_link["title"].strip()
-                team_conference_ID = conf_link["href"].split("/")[-2]
-
-            team_list.append(
-                {
-                    "team_name": team_name,
-                    "team_ID": team_ID,
-                    "team_state": team_state,
-                    "team_division": team_division,
-                    "team_division_ID": team_division_ID,
-                    "team_conference": team_conference,
-                    "team_conference_ID": team_conference_ID,
-                }
-            )
-
-        # be semi-polite to the server
-        time.sleep(0.05)
-
-
-def teamListToCSV(filename="collegeSwimmingTeams.csv"):
-    """Write the global team_list to a CSV."""
+        for content in pages:
+            yield from _parse_team_page(content)
+
+
+def getTeamList():
+    """Scrape SwimCloud's /team/ pages and return a list of all college teams."""
+    return list(iter_teams())
+
+
+def teamListToCSV(filename="collegeSwimmingTeams.csv", teams=None):
+    """Write teams (default: a fresh scrape via iter_teams()) to a CSV."""
+    if teams is None:
+        teams = iter_teams()
     with open(filename, "w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
-        writer.writerow(
-            [
-                "team_name",
-                "team_ID",
-                "team_state",
-                "team_division",
-                "team_division_ID",
-                "team_conference",
-                "team_conference_ID",
-            ]
-        )
-
-        for team in team_list:
-            writer.writerow(
-                [
-                    team["team_name"],
-                    team["team_ID"],
-                    team["team_state"],
-                    team["team_division"],
-                    team["team_division_ID"],
-                    team["team_conference"],
-                    team["team_conference_ID"],
-                ]
-            )
+        writer.writerow(TEAM_FIELDS)
+        writer.writerows([team[field] for field in TEAM_FIELDS] for team in teams)
 
 
 def build_team_dataframe():
     """Scrape SwimCloud for all college teams and return a pandas DataFrame."""
-    getTeamList()
-    return pd.DataFrame(team_list)
+    return pd.DataFrame(list(iter_teams()), columns=TEAM_FIELDS)
 
 
 def regenerate_teams_csv(path: Union[str, Path] = "collegeSwimmingTeams.csv") -> None:
     """
     Scrape SwimCloud and write the college teams table to a CSV.
 
-    The resulting CSV can be loaded by SwimScraper.py via load_teams().
+    Rows are streamed to a temp file in the same directory as each page is
+    parsed; it only replaces path once the scrape completes, so a failed
+    run leaves the existing CSV untouched. The resulting CSV can be loaded
+    by SwimScraper.py via load_teams().
     """
-    df = build_team_dataframe()
     path = Path(path)
-    df.to_csv(path, index=False, encoding="utf-8")
-    print(f"[getTeamList] Wrote {len(df)} teams to {path}")
+    n_teams = 0
+    # plain open() (not mkstemp) so the result keeps normal umask permissions
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TEAM_FIELDS, lineterminator="\n")
+            writer.writeheader()
+            for team in iter_teams():
+                writer.writerow(team)
+                n_teams += 1
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    print(f"[getTeamList] Wrote {n_teams} teams to {path}")
 
 
 if __name__ == "__main__":
+    import http_cache
+
+    # the module session already exists, so rebuild it once caching is on
+    if http_cache.install():
+        set_session(_build_session())
     regenerate_teams_csv()
@@ -0,0 +1,30 @@
+"""
+http_cache.py
+
+Optional on-disk HTTP cache for the dump scripts.
+
+install() patches requests globally via requests-cache, so repeated runs
+read identical SwimCloud pages/JSON from a local SQLite file instead of the
+network. Call it only from a script's ``__main__`` block, then rebuild the
+shared session with ``ss.set_session(ss._build_session())`` since it already
+exists by then. Does nothing if requests-cache is not installed.
+"""
+
+from pathlib import Path
+
+CACHE_PATH = Path(__file__).with_name(".swimcloud_cache.sqlite")
+EXPIRE_AFTER = 24 * 60 * 60  # seconds
+
+
+def install(path: Path = CACHE_PATH, expire_after: int = EXPIRE_AFTER) -> bool:
+    """Install the requests-cache SQLite cache; return False if unavailable."""
+    try:
+        import requests_cache
+    except ImportError:
+        print("[http_cache] requests-cache not installed; HTTP caching disabled.")
+        return False
+
+    requests_cache.install_cache(
+        str(path), backend="sqlite", expire_after=expire_after
+    )
+    return True
@@ -0,0 +1,34 @@
+"""
+memory_helpers.py
+
+Shrink pandas DataFrames before sorting/writing in the dump scripts.
+"""
+
+import pandas as pd
+
+# String columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def reduce_memory(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with smaller, lossless dtypes:
+      - integer columns downcast to the smallest int type that fits
+      - low-cardinality string columns converted to categoricals
+
+    Floats are left alone: float32 would round values that get written
+    back to disk (123456.789 -> 123456.79).
+    """
+    out = {}
+    n_rows = len(df)
+    for col, s in df.items():
+        if pd.api.types.is_integer_dtype(s):
+            s = pd.to_numeric(s, downcast="integer")
+        elif n_rows and (
+            # pandas >= 3 reads text as the "str" dtype, which is not object
+            pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s)
+        ):
+            if s.nunique(dropna=True) / n_rows <= CATEGORY_MAX_UNIQUE_RATIO:
+                s = s.astype("category")
+        out[col] = s
+    return pd.DataFrame(out, index=df.index)
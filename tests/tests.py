@@ -1,5 +1,11 @@
 from SwimScraper import SwimScraper as ss
+from SwimScraper import getTeamList as gtl
+from SwimScraper.memory_helpers import reduce_memory
+import pandas as pd
 import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
 
 # TESTS ---------------------------------------------------------------------------------------------------------------------------
 
@@ -12,6 +18,53 @@ def test_getTeams():
     div1_teams = ss.getCollegeTeams(division_names = ['Division 1'])
     assert div1_teams
 
+#getCollegeTeams / teams index tests (offline) --------------------
+TEAMS_CSV = """team_name,team_ID,team_state,team_division,team_division_ID,team_conference,team_conference_ID
+Alpha University,10,FL,Division 1,1,SEC,5
+Beta College,20,GA,Division 2,2,Peach Belt,7
+Dup U,30,TX,Division 1,1,Big 12,3
+Gamma State,40,AL,Division 1,1,SEC,5
+Dup U,50,OH,Division 3,3,OAC,9
+"""
+
+
+@pytest.fixture
+def small_teams(tmp_path):
+    original = ss.teams
+    path = tmp_path / "teams.csv"
+    path.write_text(TEAMS_CSV, encoding="utf-8")
+    ss.set_teams_csv(path)
+    yield
+    ss.teams = original
+    ss._index_teams(original)
+
+
+def _team_IDs(rows):
+    return [row["team_ID"] for row in rows]
+
+
+def test_getCollegeTeams_keepsTableOrder(small_teams):
+    assert _team_IDs(ss.getCollegeTeams(team_names=["Gamma State", "Alpha University"])) == [10, 40]
+    assert _team_IDs(ss.getCollegeTeams(division_names=["Division 1"])) == [10, 30, 40]
+    assert _team_IDs(ss.getCollegeTeams(conference_names=["OAC", "SEC"])) == [10, 40, 50]
+    assert _team_IDs(ss.getCollegeTeams()) == [10, 20, 30, 40, 50]
+
+
+def test_getCollegeTeams_duplicateAndUnknownNames(small_teams):
+    # a name repeated in the filter returns its rows once
+    assert _team_IDs(ss.getCollegeTeams(team_names=["Beta College", "Beta College"])) == [20]
+    # a name repeated in the table returns every matching row
+    assert _team_IDs(ss.getCollegeTeams(team_names=["Dup U"])) == [30, 50]
+    assert ss.getCollegeTeams(team_names=["Nowhere Tech"]) == []
+    assert ss.getCollegeTeams(conference_names=["Nowhere Conf"]) == []
+
+
+def test_teamLookups_firstMatchWins(small_teams):
+    assert ss.getTeamID("Dup U") == 30
+    assert ss.getTeamID("Nowhere Tech") == -1
+    assert ss.getTeamName(50) == "Dup U"
+    assert ss.getTeamName(999) == ""
+
 #getPowerIndex tests ----------------------------------------
 def test_getPowerIndex():
     # This test may break when Will Modglin graduates in 2023.
@@ -33,6 +86,312 @@ def test_getPowerIndex():
     print(ss.getPowerIndex(295739)) == 26.60
     print(ss.getPowerIndex(501834)) == 33.16 
 
+#_parse_recruit_page / getHSRecruitRankings tests (offline) --------
+def _recruit_page(swimmer_ID="123", div_class="c-table-clean--responsive extra"):
+    return (
+        f'<html><body><div class="{div_class}">'
+        '<table><tr><th>Name</th></tr>'
+        f'<tr><td><a href="/swimmer/{swimmer_ID}/">Jane Doe</a></td>'
+        '<td class="u-color-mute">Gainesville, FL</td>'
+        '<td><a href="/team/117/"><img alt="University of Florida logo"></a></td>'
+        '<td class="u-text-end">12.34</td></tr>'
+        '</table></div></body></html>'
+    ).encode()
+
+
+@pytest.fixture
+def restore_session():
+    original = ss._SESSION
+    yield
+    ss.set_session(original)
+
+
+def test_parseRecruitPage_multiClassDiv():
+    # table wrapper carries extra classes besides c-table-clean--responsive
+    resp = SimpleNamespace(status_code=200, content=_recruit_page())
+    recruits = ss._parse_recruit_page(resp)
+    assert recruits is not None and len(recruits) == 1
+    assert recruits[0]["swimmer_ID"] == "123"
+    assert recruits[0]["team_name"] == "University of Florida"
+
+
+def test_getHSRecruitRankings_stopsAtBadPage(restore_session):
+    # a failing later page ends pagination but keeps the pages before it
+    class StubSession:
+        def get(self, url, headers=None, params=None):
+            page = int(url.rsplit("=", 1)[-1])
+            if page == 3:
+                return SimpleNamespace(status_code=503, content=b"")
+            return SimpleNamespace(status_code=200, content=_recruit_page(str(page)))
+
+    ss.set_session(StubSession())
+    recruits = ss.getHSRecruitRankings(2028, "M")
+    assert [r["swimmer_ID"] for r in recruits] == ["1", "2"]
+
+
+def _serve_status(status):
+    """Start a local HTTP server that answers every GET with status."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_buildSession_returnsLastResponseAfterRetries():
+    # exhausted status retries must hand back the response, not raise RetryError
+    server = _serve_status(503)
+    try:
+        session = ss._build_session()
+        session.mount("http://", session.get_adapter("https://"))
+        resp = session.get(f"http://127.0.0.1:{server.server_port}/")
+        assert resp.status_code == 503
+    finally:
+        server.shutdown()
+
+#getTeamList tests (offline) -------------------------------------
+def test_teamListSession_returnsLastResponseAfterRetries():
+    server = _serve_status(503)
+    try:
+        session = gtl._build_session()
+        session.mount("http://", session.get_adapter("https://"))
+        resp = session.get(f"http://127.0.0.1:{server.server_port}/")
+        assert resp.status_code == 503
+        assert gtl._parse_team_page(resp.content) == []
+    finally:
+        server.shutdown()
+
+# no <meta charset>: the parser must still decode the page as UTF-8
+TEAM_PAGE = """<html><body><table>
+<tr><th>Team</th><th>State</th><th>Division</th><th>Conference</th></tr>
+<tr><td><a href="/team/117/"><b>University of</b> Florida</a></td><td>FL</td>
+<td><a href="/country/usa/college/division-1/" title="Division 1">D1</a></td>
+<td><a href="/conference/sec/" title="SEC">SEC</a></td></tr>
+<tr><td><a href="/team/999/">Café Club</a></td><td>ON</td><td></td><td>-</td></tr>
+</table></body></html>""".encode("utf-8")
+
+
+def test_parseTeamPage_fixture():
+    assert gtl._parse_team_page(TEAM_PAGE) == [
+        {
+            "team_name": "University of Florida",
+            "team_ID": "117",
+            "team_state": "FL",
+            "team_division": "Division 1",
+            "team_division_ID": "division-1",
+            "team_conference": "SEC",
+            "team_conference_ID": "sec",
+        },
+        {
+            "team_name": "Café Club",
+            "team_ID": "999",
+            "team_state": "NA",
+            "team_division": "NONE",
+            "team_division_ID": "NONE",
+            "team_conference": "NONE",
+            "team_conference_ID": "NONE",
+        },
+    ]
+
+
+def test_regenerateTeamsCsv_keepsFileOnFailedScrape(tmp_path, monkeypatch):
+    target = tmp_path / "teams.csv"
+    target.write_text("old contents\n", encoding="utf-8")
+
+    def failing_scrape():
+        yield {f: "x" for f in gtl.TEAM_FIELDS}
+        raise ConnectionError("network down")
+
+    monkeypatch.setattr(gtl, "iter_teams", failing_scrape)
+    with pytest.raises(ConnectionError):
+        gtl.regenerate_teams_csv(target)
+    assert target.read_text(encoding="utf-8") == "old contents\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["teams.csv"]
+
+    monkeypatch.setattr(gtl, "iter_teams", lambda: iter([{f: "y" for f in gtl.TEAM_FIELDS}]))
+    gtl.regenerate_teams_csv(target)
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines == [",".join(gtl.TEAM_FIELDS), ",".join(["y"] * len(gtl.TEAM_FIELDS))]
+
+#JSON response cache tests (offline) ------------------------------
+def _json_response(body=b"[]", status=200, headers=None):
+    return SimpleNamespace(
+        status_code=status,
+        content=body,
+        headers=headers or {},
+        raise_for_status=lambda: None,
+    )
+
+
+class _JSONStubSession:
+    """Stub session returning queued responses and recording each request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None):
+        self.calls.append({"url": url, "params": params, "headers": dict(headers or {})})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def json_cache(monkeypatch, restore_session):
+    # memory-only cache, emptied before and after each test
+    monkeypatch.setattr(ss, "_cache_path", None)
+    ss.clear_cache()
+    yield
+    monkeypatch.setattr(ss, "_cache_path", None)
+    ss.clear_cache()
+
+
+def test_jsonCache_freshHitSkipsNetwork(json_cache):
+    stub = _JSONStubSession(_json_response(b'[{"eventtime": "20.00"}]'))
+    ss.set_session(stub)
+    first = ss.getSwimmerProfileFastestTimes(433591)
+    # int and str IDs build the same URL, so they share one entry
+    second = ss.getSwimmerProfileFastestTimes("433591")
+    assert first == second == [{"eventtime": "20.00"}]
+    assert len(stub.calls) == 1
+
+
+def test_jsonCache_expiredEntryRevalidates(json_cache, monkeypatch):
+    stub = _JSONStubSession(
+        _json_response(b'[{"eventtime": "20.00"}]',
+                       headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _json_response(b"", status=304),
+    )
+    ss.set_session(stub)
+    ss.getSwimmerProfileFastestTimes(433591)
+    monkeypatch.setattr(ss, "CACHE_TTL", -1)  # everything is stale now
+    again = ss.getSwimmerProfileFastestTimes(433591)
+
+    assert again == [{"eventtime": "20.00"}]  # 304 reuses the cached body
+    assert len(stub.calls) == 2
+    assert stub.calls[0]["headers"] == {}
+    assert stub.calls[1]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_jsonCache_expiredEntryRefetchesChangedBody(json_cache, monkeypatch):
+    stub = _JSONStubSession(
+        _json_response(b"[1]", headers={"ETag": '"v1"'}),
+        _json_response(b"[2]", headers={"ETag": '"v2"'}),
+        _json_response(b"", status=304),
+    )
+    ss.set_session(stub)
+    ss.getSwimmerProfileFastestTimes(1)
+    monkeypatch.setattr(ss, "CACHE_TTL", -1)
+    assert ss.getSwimmerProfileFastestTimes(1) == [2]
+    assert ss.getSwimmerProfileFastestTimes(1) == [2]
+    assert stub.calls[2]["headers"] == {"If-None-Match": '"v2"'}
+
+
+def test_jsonCache_resultsAreIsolatedFromCache(json_cache):
+    stub = _JSONStubSession(_json_response(b'[{"place": 1}]'))
+    ss.set_session(stub)
+    fetched = ss.getSwimmerProfileFastestTimes(1)
+    fetched[0]["place"] = 99
+    hit = ss.getSwimmerProfileFastestTimes(1)
+    hit.append("extra")
+    assert ss.getSwimmerProfileFastestTimes(1) == [{"place": 1}]
+    assert len(stub.calls) == 1
+
+
+def test_jsonCache_cacheClearIsPerEndpoint(json_cache):
+    stub = _JSONStubSession(
+        _json_response(b"[1]"), _json_response(b"[2]"), _json_response(b"[3]")
+    )
+    ss.set_session(stub)
+    ss.getSwimmerProfileFastestTimes(1)
+    ss.getSwimmerTimesByEventJSON(1, "1|50|Y|1")
+    assert stub.calls[1]["params"] == {"event": "1|50|Y|1"}
+
+    ss.getSwimmerProfileFastestTimes.cache_clear()
+    assert ss.getSwimmerProfileFastestTimes(1) == [3]  # refetched
+    assert ss.getSwimmerTimesByEventJSON(1, "1|50|Y|1") == [2]  # still cached
+    assert len(stub.calls) == 3
+
+
+def test_jsonCache_shelveRoundTrip(json_cache, tmp_path):
+    ss.set_cache_path(tmp_path / "swimcache")
+    stub = _JSONStubSession(_json_response(b'{"results": [1]}'), _json_response(b"[2]"))
+    ss.set_session(stub)
+    ss.getSwimmerProfileFastestTimes(1)
+
+    ss._cache.clear()  # drop the memory layer only; disk entry survives
+    assert ss.getSwimmerProfileFastestTimes(1) == {"results": [1]}
+    assert len(stub.calls) == 1
+
+    ss.clear_cache()  # clears disk as well
+    ss._cache.clear()
+    assert ss.getSwimmerProfileFastestTimes(1) == [2]
+    assert len(stub.calls) == 2
+
+#convert_times_vectorized tests (offline) -------------------------
+def _scalar_times(times):
+    converted = [ss.convertTime(t) for t in times]
+    return [float("nan") if t is None else t for t in converted]
+
+
+def test_convertTimesVectorized_matchesConvertTime():
+    times = ["1:02.5", "59.3", "DQ", None, "1:00"]
+    result = ss.convert_times_vectorized(times)
+    assert result.dtype == "float64"
+    assert result.tolist() == pytest.approx(_scalar_times(times), nan_ok=True)
+
+
+def test_convertTimesVectorized_integralTimesAreFloat():
+    result = ss.convert_times_vectorized(["1:00", "2:00"])
+    assert result.dtype == "float64"
+    assert result.tolist() == [60.0, 120.0]
+
+
+def test_convertTimesVectorized_noColonSeries():
+    # str.split yields a single column here, so the reindex path fills it
+    times = pd.Series(["59.3", "22", "DNS"])
+    result = ss.convert_times_vectorized(times)
+    assert result.dtype == "float64"
+    assert result.tolist() == pytest.approx(_scalar_times(times), nan_ok=True)
+
+#reduce_memory tests (offline) ------------------------------------
+def test_reduceMemory_dtypes():
+    df = pd.DataFrame({
+        "year": [2021, 2022, 2023, 2024],
+        "score": [123456.789, 1.5, None, 2.25],
+        "gender": ["M", "M", "F", "M"],
+        "swimmer_ID": ["1", "2", "3", "4"],
+        "obj": pd.Series(["a", "a", "a", "b"], dtype=object),
+    })
+    out = reduce_memory(df)
+
+    assert out["year"].dtype == "int16"
+    assert out["year"].tolist() == df["year"].tolist()
+    # floats stay float64 so values round-trip exactly
+    assert out["score"].dtype == "float64"
+    assert out["score"].equals(df["score"])
+    # low-cardinality text (pandas 3 "str" or object) becomes categorical
+    assert isinstance(out["gender"].dtype, pd.CategoricalDtype)
+    assert isinstance(out["obj"].dtype, pd.CategoricalDtype)
+    assert out["gender"].tolist() == df["gender"].tolist()
+    # all-distinct text stays as it was
+    assert not isinstance(out["swimmer_ID"].dtype, pd.CategoricalDtype)
+
+
+def test_reduceMemory_pandasStrDtype():
+    s = pd.Series(["FL", "FL", "GA", "FL"], dtype="string")
+    out = reduce_memory(pd.DataFrame({"state": s}))
+    assert isinstance(out["state"].dtype, pd.CategoricalDtype)
+
 #getRoster tests -----------------------------------------------
 
 #check invalid team tame